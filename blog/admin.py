@@ -1,4 +1,5 @@
 from django.contrib import admin
+from django.db import connection
 from .models import Category, Post, Comment
 
 
@@ -16,14 +17,59 @@ class PostAdmin(admin.ModelAdmin):
     filter_horizontal = ('categories',)
     date_hierarchy = 'created_on'
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).prefetch_related('categories')
+
+    def get_search_results(self, request, queryset, search_term):
+        # On PostgreSQL, use full-text search instead of the default
+        # LIKE '%term%' chain, which scans every row.
+        if search_term and connection.vendor == 'postgresql':
+            from django.contrib.postgres.search import (
+                SearchQuery, SearchRank, SearchVector,
+            )
+            vector = SearchVector('title', weight='A') + SearchVector('body', weight='B')
+            query = SearchQuery(search_term)
+            queryset = (
+                queryset.annotate(search=vector, rank=SearchRank(vector, query))
+                .filter(search=query)
+                .order_by('-rank')
+            )
+            return queryset, False
+        return super().get_search_results(request, queryset, search_term)
+
 
 @admin.register(Comment)
 class CommentAdmin(admin.ModelAdmin):
-    list_display = ('get_author', 'post', 'created_on')
-    list_filter = ('created_on',)
+    list_display = ('get_author', 'post', 'approved', 'created_on')
+    list_filter = ('approved', 'created_on')
     search_fields = ('body', 'author', 'user__username')
     raw_id_fields = ('post', 'user')
-    
+    list_select_related = ('user', 'post')
+    actions = ['approve_comments', 'unapprove_comments']
+
     def get_author(self, obj):
-        return obj.user.username if obj.user else obj.author
+        return obj.user.username if obj.user_id else obj.author
     get_author.short_description = 'Author'
+
+    # Bulk actions use queryset.update() so each runs as a single UPDATE
+    # instead of one save() per row.
+    @admin.action(description='Approve selected comments')
+    def approve_comments(self, request, queryset):
+        queryset.update(approved=True)
+
+    @admin.action(description='Unapprove selected comments')
+    def unapprove_comments(self, request, queryset):
+        queryset.update(approved=False)
+
+    def get_search_results(self, request, queryset, search_term):
+        if search_term and connection.vendor == 'postgresql':
+            from django.contrib.postgres.search import SearchQuery, SearchVector
+            # Cover the same fields as search_fields, including the
+            # commenter's username.
+            vector = SearchVector('body', 'author', 'user__username')
+            queryset = (
+                queryset.annotate(search=vector)
+                .filter(search=SearchQuery(search_term))
+            )
+            return queryset, False
+        return super().get_search_results(request, queryset, search_term)
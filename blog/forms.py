@@ -1,14 +1,15 @@
 from django import forms
-from .models import Comment, Post, Category
+from .models import Category, Post
 
 
-class CommentForm(forms.ModelForm):  
-    class Meta:  
-        model = Comment  
-        fields = ("body",)  # Only body field - user comes from request.user
-        widgets = {
-            "body": forms.Textarea(attrs={"rows": 3}),
-        }
+# A plain Form, not a ModelForm: the view creates the Comment itself
+# (user comes from request.user), so there is no need for ModelForm's
+# model introspection and second validation pass per POST.
+class CommentForm(forms.Form):
+    body = forms.CharField(
+        widget=forms.Textarea(attrs={"rows": 3}),
+        max_length=10000,
+    )
 
 
 class PostForm(forms.ModelForm):
@@ -19,3 +20,11 @@ class PostForm(forms.ModelForm):
             "body": forms.Textarea(attrs={"rows": 10}),
             "categories": forms.CheckboxSelectMultiple(),
         }
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # The checkbox widget only needs id and name per category; fetch
+        # just those columns, in a stable order.
+        self.fields["categories"].queryset = (
+            Category.objects.only("id", "name").order_by("name")
+        )
@@ -0,0 +1,32 @@
+# Generated by Django 6.0.2 on 2026-08-31 04:55
+
+import django.db.models.functions.text
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0002_comment_user_alter_comment_author'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='category',
+            index=models.Index(fields=['name'], name='blog_catego_name_cb8828_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='category',
+            index=models.Index(django.db.models.functions.text.Lower('name'), name='cat_name_lower_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(fields=['post', '-created_on'], name='blog_commen_post_id_91c148_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['-created_on'], name='blog_post_created_898b61_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 6.0.2 on 2026-08-31 04:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0006_alter_comment_post'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='comment',
+            name='approved',
+            field=models.BooleanField(default=True),
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 6.0.2 on 2026-08-31 05:40
+
+from django.db import migrations, models
+from django.utils.text import slugify
+
+
+def populate_slugs(apps, schema_editor):
+    Category = apps.get_model('blog', 'Category')
+    for category in Category.objects.filter(slug__isnull=True):
+        # Same fallback as Category.save(): punctuation-only or non-ASCII
+        # names slugify to '', which no category URL could ever match.
+        slug = slugify(category.name) or 'category'
+        # Keep slugs unique even if two names collide after slugification.
+        candidate = slug
+        suffix = 2
+        while Category.objects.filter(slug=candidate).exclude(pk=category.pk).exists():
+            candidate = f'{slug}-{suffix}'
+            suffix += 1
+        category.slug = candidate
+        category.save(update_fields=['slug'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0007_comment_approved'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='category',
+            name='slug',
+            field=models.SlugField(max_length=40, null=True),
+        ),
+        migrations.RunPython(populate_slugs, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='category',
+            name='slug',
+            field=models.SlugField(max_length=40, unique=True),
+        ),
+    ]
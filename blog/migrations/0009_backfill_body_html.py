@@ -0,0 +1,28 @@
+# Generated by Django 6.0.2 on 2026-08-31 06:10
+
+import markdown as md
+from django.db import migrations
+
+
+def backfill_body_html(apps, schema_editor):
+    Post = apps.get_model('blog', 'Post')
+    parser = md.Markdown(extensions=['fenced_code', 'codehilite', 'tables'])
+    for post in Post.objects.filter(body_html='').iterator():
+        post.body_html = parser.reset().convert(post.body)
+        post.save(update_fields=['body_html'])
+
+
+def clear_body_html(apps, schema_editor):
+    Post = apps.get_model('blog', 'Post')
+    Post.objects.update(body_html='')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0008_category_slug'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_body_html, clear_body_html),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 6.0.2 on 2026-08-31 05:05
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0009_backfill_body_html'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='category',
+            name='blog_catego_name_cb8828_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='category',
+            name='cat_name_lower_idx',
+        ),
+    ]
@@ -1,13 +1,37 @@
+from django.core.cache import cache
 from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils.text import slugify
 from django.contrib.auth.models import User
 
+from .templatetags.markdown_extras import markdown as render_markdown
+
+CATEGORIES_CACHE_KEY = 'blog:categories'
+
 
 class Category(models.Model):
     name = models.CharField(max_length=30)
+    slug = models.SlugField(max_length=40, unique=True)
 
     class Meta:
         verbose_name_plural = "categories"
 
+    def save(self, *args, **kwargs):
+        if not self.slug:
+            # slugify() strips punctuation-only and non-ASCII names down
+            # to '', which would break every category link, so fall back
+            # to a fixed stem (kept ASCII to match the <slug:> URL
+            # converter). Suffix the slug if another category claimed it.
+            base = slugify(self.name) or 'category'
+            slug = base
+            suffix = 2
+            while Category.objects.filter(slug=slug).exclude(pk=self.pk).exists():
+                slug = f'{base}-{suffix}'
+                suffix += 1
+            self.slug = slug
+        super().save(*args, **kwargs)
+
     def __str__(self):
         return self.name
 
@@ -15,27 +39,61 @@ class Category(models.Model):
 class Post(models.Model):
     title = models.CharField(max_length=255)
     body = models.TextField()
+    body_html = models.TextField(blank=True, editable=False)
     created_on = models.DateTimeField(auto_now_add=True)
     last_modified = models.DateTimeField(auto_now=True)
     categories = models.ManyToManyField("Category", related_name="posts")
 
+    class Meta:
+        ordering = ['-created_on']
+        indexes = [
+            models.Index(fields=['-created_on']),
+        ]
+
+    def save(self, *args, **kwargs):
+        # Render markdown once at save time instead of on every request.
+        self.body_html = render_markdown(self.body)
+        super().save(*args, **kwargs)
+
     def __str__(self):
         return self.title
 
     
 class Comment(models.Model):
     user = models.ForeignKey(
-        User, 
-        on_delete=models.SET_NULL, 
-        null=True, 
-        blank=True, 
+        User,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        db_index=True,
         related_name="comments"
     )
     author = models.CharField(max_length=60, blank=True)
     body = models.TextField()
+    approved = models.BooleanField(default=True)
     created_on = models.DateTimeField(auto_now_add=True)
-    post = models.ForeignKey("Post", on_delete=models.CASCADE)
+    post = models.ForeignKey(
+        "Post",
+        on_delete=models.CASCADE,
+        db_index=True,
+        related_name="comments"
+    )
+
+    class Meta:
+        ordering = ['-created_on']
+        indexes = [
+            models.Index(fields=['post', '-created_on']),
+        ]
 
     def __str__(self):
-        return self.user.username if self.user else self.author
+        # Check user_id rather than user: reading the FK column never
+        # hits the database, while self.user would fetch the related row
+        # just to find out it is None.
+        return self.user.username if self.user_id else self.author
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def _clear_categories_cache(sender, **kwargs):
+    cache.delete(CATEGORIES_CACHE_KEY)
     
\ No newline at end of file
@@ -5,12 +5,13 @@ import markdown as md
 
 register = template.Library()
 
+# Reuse one parser instead of letting md.markdown() rebuild the extension
+# stack on every call.
+_MD = md.Markdown(extensions=['fenced_code', 'codehilite', 'tables'])
+
 
 @register.filter()
 @stringfilter
 def markdown(value):
     """Convert markdown text to HTML."""
-    try:
-        return mark_safe(md.markdown(value, extensions=['fenced_code', 'codehilite', 'tables']))
-    except Exception:
-        return value
+    return mark_safe(_MD.reset().convert(value))
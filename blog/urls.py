@@ -6,5 +6,5 @@ urlpatterns = [
     path('post/<int:pk>/', views.blog_detail, name='blog_detail'),
     path('post/new/', views.post_new, name='post_new'),
     path('post/<int:pk>/edit/', views.post_edit, name='post_edit'),
-    path('category/<str:category>/', views.blog_category, name='blog_category'),
+    path('category/<slug:slug>/', views.blog_category, name='blog_category'),
 ]
\ No newline at end of file
@@ -1,30 +1,75 @@
 from django.shortcuts import render, get_object_or_404, redirect
+from django.db.models import Prefetch
+from django.core.cache import cache
+from django.core.paginator import Paginator
 from django.contrib.auth.decorators import login_required
-from django.http import HttpResponseForbidden
-from .models import Post, Category, Comment
+from django.http import Http404, HttpResponseForbidden
+from django.views.decorators.http import require_http_methods, require_safe
+from .models import Post, Category, Comment, CATEGORIES_CACHE_KEY
 from .forms import CommentForm, PostForm
 
 
+@require_safe
 def blog_index(request):
-    posts = Post.objects.all().order_by('-created_on')
-    categories = Category.objects.all()
+    # List pages never render the raw markdown body, so skip fetching it.
+    posts = Post.objects.only('id', 'title', 'body_html', 'created_on').prefetch_related('categories')
+    categories = cache.get_or_set(
+        CATEGORIES_CACHE_KEY, lambda: list(Category.objects.all()), 300
+    )
+    paginator = Paginator(posts, 20)
+    page_obj = paginator.get_page(request.GET.get('page'))
     context = {
-        'posts': posts,
+        'posts': page_obj,
+        'page_obj': page_obj,
         'categories': categories
     }
     return render(request, 'blog_index.html', context)
 
 
+@require_http_methods(["GET", "HEAD", "POST"])
 def blog_detail(request, pk):
-    post = get_object_or_404(Post, pk=pk)
-    context = {'post': post}
+    form = CommentForm()
+    if request.method == 'POST':
+        if not request.user.is_authenticated:
+            return redirect('login')
+        # The POST branch only needs the post's pk, so skip the full row
+        # fetch and link the comment by id.
+        if not Post.objects.filter(pk=pk).exists():
+            raise Http404("Post does not exist")
+        form = CommentForm(request.POST)
+        if form.is_valid():
+            Comment.objects.create(
+                post_id=pk, user=request.user, body=form.cleaned_data['body']
+            )
+            return redirect('blog_detail', pk=pk)
+
+    post = get_object_or_404(
+        Post.objects.prefetch_related(
+            'categories',
+            Prefetch(
+                'comments',
+                queryset=Comment.objects.filter(approved=True).select_related('user'),
+                to_attr='ordered_comments',
+            ),
+        ),
+        pk=pk,
+    )
+    context = {'post': post, 'comments': post.ordered_comments, 'form': form}
     return render(request, 'blog_detail.html', context)
 
-def blog_category(request, category):
-    posts = Post.objects.filter(categories__name__iexact=category).order_by('-created_on')
+@require_safe
+def blog_category(request, slug):
+    category = get_object_or_404(Category, slug=slug)
+    posts = (
+        category.posts.only('id', 'title', 'body_html', 'created_on')
+        .prefetch_related('categories')
+    )
+    paginator = Paginator(posts, 20)
+    page_obj = paginator.get_page(request.GET.get('page'))
     context = {
         'category': category,
-        'posts': posts
+        'posts': page_obj,
+        'page_obj': page_obj
     }
     return render(request, 'blog_category.html', context)
 